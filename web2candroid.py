@@ -10,22 +10,83 @@
 """
 
 import os
+import io
 import sys
+import stat
+import tarfile
+import hashlib
 import shutil
+import functools
 import argparse
 import subprocess
 import platform
-import datetime
+import threading
+import uuid
+import string
+import time
+import zlib
 import zipfile
+import urllib.parse
+from html.parser import HTMLParser
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Optional: used for the parallel mirroring fast path. Falls back to wget.
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+
+# Optional: io_uring backend for bulk small-file copies on Linux >= 5.1.
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+# Optional: multithreaded zstd for the project snapshot cache. Falls back
+# to stdlib gzip tarballs when not installed.
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Optional: libdeflate compresses ~2x faster than zlib at the same level.
+# Falls back to the stdlib deflater for compressible zip entries.
+try:
+    import deflate
+except ImportError:
+    deflate = None
+
 # ===========================================================================
 # CONFIGURATION
 # ===========================================================================
-ROOT_DIR = Path.cwd().resolve()
-OUTPUT_DIR = ROOT_DIR / "output"
 LOG_PREFIX = "[Web2Native]"
 
+_root_dir_cache = None
+
+def root_dir():
+    # Lazy: importing the module (e.g. for --help) shouldn't pay the
+    # getcwd()/lstat chain. Path.cwd() is already absolute, no resolve().
+    global _root_dir_cache
+    if _root_dir_cache is None:
+        _root_dir_cache = Path.cwd()
+    return _root_dir_cache
+
+def output_dir():
+    return root_dir() / "output"
+
+# Cleanup only touches these; everything else under work_dir (notably
+# Gradle's .gradle state) is incremental-build fuel worth keeping around
+TRANSIENT_SUBDIRS = ("assets", "android_project/app/build")
+
+# Resolved once at import: calling shutil.which() per build re-scans every
+# PATH entry (a stat apiece) for the same answer
+_GRADLE = shutil.which("gradle.bat" if platform.system() == "Windows" else "gradle")
+
+# Shared pool for overlapping the network-bound download with local work
+_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
 class Colors:
     GREEN = '\033[92m'
     WARNING = '\033[93m'
@@ -33,45 +94,377 @@ class Colors:
     ENDC = '\033[0m'
     BOLD = '\033[1m'
 
+# Per-level prefixes are pre-encoded once so each log call is a single
+# buffer write instead of three f-string interpolations plus a datetime.
+_LOG_PREFIXES = {
+    "INFO": f"{Colors.GREEN}{LOG_PREFIX} [INFO] ".encode(),
+    "WARN": f"{Colors.WARNING}{LOG_PREFIX} [WARN] ".encode(),
+    "ERROR": f"{Colors.FAIL}{LOG_PREFIX} [ERROR] ".encode(),
+}
+_LOG_SUFFIX = Colors.ENDC.encode() + b"\n"
+
+# Bound once: log() references these as globals instead of re-doing the
+# time.strftime attribute lookup and format-literal load on every call.
+_strftime = time.strftime
+_TIME_FMT = "%H:%M:%S"
+
 def log(msg, level="INFO"):
-    timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-    if level == "INFO":
-        print(f"{Colors.GREEN}{LOG_PREFIX} [INFO] {timestamp} - {msg}{Colors.ENDC}")
-    elif level == "WARN":
-        print(f"{Colors.WARNING}{LOG_PREFIX} [WARN] {timestamp} - {msg}{Colors.ENDC}")
-    elif level == "ERROR":
-        print(f"{Colors.FAIL}{LOG_PREFIX} [ERROR] {timestamp} - {msg}{Colors.ENDC}")
-    elif level == "STEP":
+    if level == "STEP":
         print(f"\n{Colors.BOLD}>>> {msg} <<<{Colors.ENDC}")
+        return
+    prefix = _LOG_PREFIXES.get(level)
+    if prefix is not None:
+        sys.stdout.buffer.write(prefix + _strftime(_TIME_FMT).encode()
+                                + b" - " + str(msg).encode() + _LOG_SUFFIX)
+        sys.stdout.buffer.flush()
+
+def _copy_file_data(src, dst):
+    """
+    Copies file contents with os.copy_file_range (in-kernel, zero-copy on
+    Linux >= 4.5), falling back to os.sendfile and finally the plain
+    buffered loop. Metadata is intentionally not copied.
+    """
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        if size == 0:
+            return
+        def _rewind():
+            # A stage can fail after moving some bytes; both ends must be
+            # reset or the next stage appends after / duplicates the
+            # partial data already in the destination
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
 
-def resolve_asset_path(path_str, asset_name):
+        try:
+            remaining = size
+            while remaining > 0:
+                sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if sent == 0:
+                    break
+                remaining -= sent
+            return
+        except (AttributeError, OSError):
+            _rewind()
+        try:
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+            return
+        except (AttributeError, OSError):
+            _rewind()
+        shutil.copyfileobj(fsrc, fdst)
+
+def _fast_copytree(src, dst):
     """
-    Smartly resolves paths (handles ~, relative paths) and checks existence.
-    Returns absolute Path object or None.
+    Copies a directory tree using one os.scandir pass per directory.
+    DirEntry.is_dir reuses readdir's d_type. Files are hardlinked when
+    source and destination share a filesystem (zero bytes moved); only a
+    cross-device link failure falls back to the kernel-side data copy.
     """
-    if not path_str:
+    queue = [(str(src), str(dst))]
+    while queue:
+        src_dir, dst_dir = queue.pop(0)
+        os.makedirs(dst_dir, exist_ok=True)
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                target = os.path.join(dst_dir, entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    queue.append((entry.path, target))
+                else:
+                    try:
+                        os.link(entry.path, target)
+                    except OSError:
+                        _copy_file_data(entry.path, target)
+
+def _uring_copy_impl(src, dst, depth):
+    # Gather (src, dst, size) for every file, creating directories as we go
+    files = []
+    queue = [(str(src), str(dst))]
+    while queue:
+        src_dir, dst_dir = queue.pop(0)
+        os.makedirs(dst_dir, exist_ok=True)
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                target = os.path.join(dst_dir, entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    queue.append((entry.path, target))
+                else:
+                    files.append((entry.path, target, entry.stat().st_size))
+
+    ring = liburing.io_uring()
+    cqe = liburing.io_uring_cqe()
+    liburing.io_uring_queue_init(depth, ring, 0)
+    try:
+        for start in range(0, len(files), depth):
+            # Phase 1: batched reads. user_data maps each completion back
+            # to its file, since the kernel reaps them in any order.
+            handles = []
+            for s, d, size in files[start:start + depth]:
+                fsrc = os.open(s, os.O_RDONLY)
+                fdst = os.open(d, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                buf = bytearray(size)
+                iov = liburing.iovec(buf)
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_readv(sqe, fsrc, iov, 1, 0)
+                sqe.user_data = len(handles)
+                handles.append([fsrc, fdst, buf, iov, 0])
+            liburing.io_uring_submit(ring)
+            for _ in range(len(handles)):
+                liburing.io_uring_wait_cqe(ring, cqe)
+                res, idx = cqe.res, cqe.user_data
+                liburing.io_uring_cqe_seen(ring, cqe)
+                if res < 0:
+                    raise OSError(-res, os.strerror(-res))
+                handles[idx][4] = res
+            # Phase 2: writes sized to what each read actually returned,
+            # so a short read never pads the destination with zeros
+            wiovs = []
+            for idx, (fsrc, fdst, buf, iov, nread) in enumerate(handles):
+                if nread != len(buf):
+                    del buf[nread:]
+                    iov = liburing.iovec(buf)
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_writev(sqe, fdst, iov, 1, 0)
+                sqe.user_data = idx
+                wiovs.append(iov)  # keep the buffers alive until reaped
+            liburing.io_uring_submit(ring)
+            for _ in range(len(handles)):
+                liburing.io_uring_wait_cqe(ring, cqe)
+                res, idx = cqe.res, cqe.user_data
+                liburing.io_uring_cqe_seen(ring, cqe)
+                if res < 0:
+                    raise OSError(-res, os.strerror(-res))
+                if res != handles[idx][4]:
+                    raise OSError(f"short io_uring write on {files[start + idx][1]}")
+            for fsrc, fdst, _, _, _ in handles:
+                os.close(fsrc)
+                os.close(fdst)
+    finally:
+        liburing.io_uring_queue_exit(ring)
+
+def _uring_copy_tree(src, dst, depth=64):
+    """
+    Copies a tree of small files through io_uring so the open/read/write
+    syscalls execute in parallel across files instead of serializing per
+    file. Falls through to _fast_copytree when liburing is unavailable.
+    """
+    if liburing is None or platform.system() != "Linux":
+        _fast_copytree(src, dst)
+        return
+    try:
+        _uring_copy_impl(src, dst, depth)
+    except Exception as e:
+        log(f"io_uring copy unavailable ({e}). Using scandir copy.", "WARN")
+        _fast_copytree(src, dst)
+
+def _adopt_entry(entry, dst):
+    """
+    Moves a downloaded entry into place with os.rename — an O(1) inode
+    update since temp_dl lives inside the target directory. Falls back to
+    a real copy when the rename is refused (cross-device, existing
+    non-empty destination from a prior run, ...).
+    """
+    try:
+        os.rename(entry.path, dst)
+    except OSError:
+        if entry.is_dir(follow_symlinks=False):
+            _uring_copy_tree(entry.path, dst)
+        else:
+            _copy_file_data(entry.path, dst)
+
+def _dir_names(d):
+    """One readdir sweep of a directory; a missing dir (failed build step)
+    simply yields no names instead of an exception per probe."""
+    try:
+        with os.scandir(d) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
+def _link_or_copy(src, dst):
+    """
+    Stages a file with a hardlink — zero bytes written when src and dst
+    share a filesystem, and the later cleanup just drops one name off the
+    inode. Falls back to a real copy (cross-device, FAT, ...).
+    """
+    try:
+        if os.path.exists(dst):
+            os.unlink(dst)
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+def _fast_rmtree(root):
+    """
+    Removes a directory tree with an explicit stack and os.scandir, so the
+    dir/file decision comes from readdir's d_type instead of a stat() per
+    entry as shutil.rmtree issues.
+    """
+    stack = [str(root)]
+    pending_dirs = []
+    while stack:
+        d = stack.pop()
+        pending_dirs.append(d)
+        with os.scandir(d) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    os.unlink(entry.path)
+    for d in reversed(pending_dirs):
+        os.rmdir(d)
+
+def _find_index_root(root, max_depth=None):
+    """
+    Recursively locates the directory containing index.html using os.scandir,
+    which reuses the d_type info from readdir instead of stat()-ing each entry.
+    With max_depth set, the descent stops after that many levels so shallow
+    hits (wget puts index.html 1-2 dirs deep) skip the rest of the tree.
+    Returns the directory path (str) or None.
+    """
+    subdirs = []
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name == "index.html":
+                return root
+    if max_depth is not None and max_depth <= 1:
         return None
-    
-    # Expand user (~) and resolve absolute path
-    path = Path(os.path.expanduser(path_str)).resolve()
-    
-    if path.exists() and path.is_file():
-        log(f"Found custom {asset_name}: {path}", "INFO")
-        return path
+    next_depth = None if max_depth is None else max_depth - 1
+    for sub in subdirs:
+        found = _find_index_root(sub, next_depth)
+        if found:
+            return found
+    return None
+
+@functools.lru_cache(maxsize=128)
+def _resolve_cached(path_str, asset_name):
+    # Expand user (~) and resolve absolute path. String-level os.path
+    # primitives avoid the per-component lstat that Path.resolve() issues;
+    # str return keeps the result hashable for the cache.
+    abs_path = os.path.abspath(os.path.expanduser(path_str))
+
+    # One stat() answers both "exists" and "is a regular file"
+    try:
+        is_file = stat.S_ISREG(os.stat(abs_path).st_mode)
+    except OSError:
+        is_file = False
+
+    if is_file:
+        log(f"Found custom {asset_name}: {abs_path}", "INFO")
+        return abs_path
     else:
         log(f"Could NOT find {asset_name} at: {path_str}", "WARN")
-        log(f"-> Verified absolute path was: {path}", "WARN")
+        log(f"-> Verified absolute path was: {abs_path}", "WARN")
         log(f"-> Proceeding with default {asset_name}.", "WARN")
         return None
 
+def resolve_asset_path(path_str, asset_name):
+    """
+    Smartly resolves paths (handles ~, relative paths) and checks existence.
+    Memoized, so repeat lookups of the same asset skip the stat chain.
+    Returns absolute Path object or None.
+    """
+    if not path_str:
+        return None
+    resolved = _resolve_cached(path_str, asset_name)
+    return Path(resolved) if resolved else None
+
 # ===========================================================================
 # ASSET BUNDLING
 # ===========================================================================
+class _RequisiteParser(HTMLParser):
+    """Collects the URLs of page requisites (css, scripts, images) from HTML."""
+    def __init__(self):
+        super().__init__()
+        self.urls = set()
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "link" and attrs.get("href"):
+            self.urls.add(attrs["href"])
+        elif tag in ("script", "img") and attrs.get("src"):
+            self.urls.add(attrs["src"])
+
+def _fetch_requisite(session, url, target_path):
+    rel = urllib.parse.urlsplit(url).path.lstrip("/") or "index.html"
+    # A hostile page can reference "../../../../etc/x"; normalize and keep
+    # the destination pinned inside the assets dir (wget's mirror mode
+    # applies the same sanitization)
+    rel = os.path.normpath(rel)
+    if os.path.isabs(rel) or rel == ".." or rel.startswith(".." + os.sep):
+        raise ValueError(f"requisite path escapes the assets dir: {url}")
+    dest = target_path / rel
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    with session.get(url, stream=True, timeout=30) as resp:
+        resp.raise_for_status()
+        # The raw socket stream carries whatever Content-Encoding the
+        # server chose (usually gzip for css/js); decode it on the way
+        # out or the offline bundle ships compressed blobs
+        resp.raw.decode_content = True
+        with open(dest, "wb") as f:
+            shutil.copyfileobj(resp.raw, f)
+
+def _parallel_mirror(url, target_path, workers=8):
+    """
+    Mirrors the index page plus its requisites concurrently over a pooled
+    keep-alive session. I/O-bound, so threads are enough; one TCP/TLS
+    handshake is amortized across all assets instead of paid per file.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    resp = session.get(url, timeout=30)
+    resp.raise_for_status()
+    (target_path / "index.html").write_bytes(resp.content)
+
+    parser = _RequisiteParser()
+    parser.feed(resp.text)
+    base = resp.url
+    requisites = {urllib.parse.urljoin(base, u) for u in parser.urls}
+    requisites = {u for u in requisites if u.startswith(("http://", "https://"))}
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_fetch_requisite, session, u, target_path) for u in requisites]
+        for f in futures:
+            try:
+                f.result()
+            except Exception as e:
+                log(f"Skipped asset: {e}", "WARN")
+
 def bundle_website(url, target_path):
-    log(f"Downloading website assets from {url}...", "STEP")
+    # Accepts a single URL or a list of URLs (batched into one wget run)
+    urls = [url] if isinstance(url, str) else list(url)
+
+    # Fast-fail on malformed URLs before any mkdir or wget fork+exec
+    for u in urls:
+        parts = urllib.parse.urlsplit(u)
+        if parts.scheme not in ("http", "https") or not parts.netloc:
+            log(f"Invalid URL: {u} (expected http(s)://host/...)", "ERROR")
+            sys.exit(1)
+
+    log(f"Downloading website assets from {', '.join(urls)}...", "STEP")
     target_path.mkdir(parents=True, exist_ok=True)
+
+    # FAST PATH: parallel keep-alive mirror when requests is installed
+    if requests is not None:
+        try:
+            for u in urls:
+                _parallel_mirror(u, target_path)
+            log(f"Assets cached locally at {target_path}")
+            return
+        except Exception as e:
+            log(f"Parallel mirror failed ({e}). Falling back to wget.", "WARN")
+
     temp_download = target_path / "temp_dl"
-    if temp_download.exists(): shutil.rmtree(temp_download)
+    if temp_download.exists(): _fast_rmtree(temp_download)
     temp_download.mkdir()
     
     cmd = [
@@ -81,97 +474,105 @@ def bundle_website(url, target_path):
         "--adjust-extension", 
         "--page-requisites", 
         "--no-parent", 
-        "--level=1", 
-        "--execute", "robots=off", 
+        "--level=1",
+        "--compression=auto",
+        "--execute", "robots=off",
         "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36", 
-        "--directory-prefix", str(temp_download), 
-        url
+        "--directory-prefix", str(temp_download),
+        "-i", "-"
     ]
-    
+
     try:
-        subprocess.run(cmd, check=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        found = False
-        for root, dirs, files in os.walk(temp_download):
-            if "index.html" in files:
-                for item in os.listdir(root):
-                    s = os.path.join(root, item)
-                    d = os.path.join(target_path, item)
-                    if os.path.isdir(s): shutil.copytree(s, d, dirs_exist_ok=True)
-                    else: shutil.copy2(s, d)
-                found = True
-                break
-        
-        if not found:
+        # One wget process for the whole batch: URLs go in on stdin, so
+        # wget's keep-alive and DNS cache are shared across all of them.
+        # Output is discarded anyway: DEVNULL avoids allocating two pipes
+        # and buffering megabytes of wget chatter in memory.
+        subprocess.run(cmd, check=False, input="\n".join(urls).encode(),
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        # Shallow-first: wget's mirror layout puts index.html one or two
+        # levels deep, so a bounded search usually avoids walking the tree.
+        index_root = (_find_index_root(temp_download, max_depth=3)
+                      or _find_index_root(temp_download))
+        if index_root:
+            target_str = str(target_path)  # hoisted: skip per-entry PurePath work
+            with os.scandir(index_root) as it:
+                for entry in it:
+                    _adopt_entry(entry, os.path.join(target_str, entry.name))
+
+        if not index_root:
             log("Warning: Specific index.html not found. Copying all files.", "WARN")
-            shutil.copytree(temp_download, target_path, dirs_exist_ok=True)
+            target_str = str(target_path)
+            with os.scandir(temp_download) as it:
+                for entry in it:
+                    _adopt_entry(entry, os.path.join(target_str, entry.name))
 
-        shutil.rmtree(temp_download)
+        _fast_rmtree(temp_download)
         log(f"Assets cached locally at {target_path}")
 
     except Exception as e:
         log(f"Asset Error: {e}", "ERROR")
         sys.exit(1)
 
+def bundle_website_async(url, target_path):
+    """
+    Kicks the website download off in the background and returns a Future,
+    so the caller can scaffold the Android project while wget is busy on
+    the network.
+    """
+    return _EXECUTOR.submit(bundle_website, url, target_path)
+
 # ===========================================================================
 # ANDROID BUILDER
 # ===========================================================================
-def build_android_native(work_dir, app_name, package_name, assets_path, icon_path, splash_path, archs, target_url):
-    log("Starting Native Android Build (Dual Mode)...", "STEP")
-    
-    android_root = work_dir / "android_project"
-    if android_root.exists(): shutil.rmtree(android_root)
-    android_root.mkdir()
-    
-    package_path = package_name.replace('.', '/')
-    app_dir = android_root / "app"
-    src_main = app_dir / "src/main"
-    java_dir = src_main / f"java/{package_path}"
-    res_dir = src_main / "res"
-    layout_dir = res_dir / "layout"
-    assets_target = src_main / "assets"
-    
-    java_dir.mkdir(parents=True)
-    res_dir.mkdir(parents=True)
-    layout_dir.mkdir(parents=True)
-    assets_target.mkdir(parents=True)
-    
-    shutil.copytree(assets_path, assets_target / "www", dirs_exist_ok=True)
 
-    ndk_abi_filters = ""
-    if archs:
-        abi_list = [f"'{a.strip()}'" for a in archs.split(',')]
-        ndk_abi_filters = f"ndk {{ abiFilters {', '.join(abi_list)} }}"
+# Argument-free templates are built and encoded exactly once at import;
+# only the templates that interpolate build arguments stay as runtime
+# f-strings. settings.gradle needs just the app name, so it's a cheap
+# prefix/suffix join instead of a full format pass.
 
-    # SETTINGS.GRADLE
-    (android_root / "settings.gradle").write_text(f'''
-pluginManagement {{
-    repositories {{
+_SETTINGS_GRADLE_PREFIX = b'''
+pluginManagement {
+    repositories {
         google()
         mavenCentral()
         gradlePluginPortal()
-    }}
-}}
-dependencyResolutionManagement {{
+    }
+}
+dependencyResolutionManagement {
     repositoriesMode.set(RepositoriesMode.FAIL_ON_PROJECT_REPOS)
-    repositories {{
+    repositories {
         google()
         mavenCentral()
-    }}
-}}
-rootProject.name = "{app_name}"
-include ':app'
-''', encoding='utf-8')
+    }
+}
+rootProject.name = "'''
 
-    # GRADLE.PROPERTIES
-    (android_root / "gradle.properties").write_text('''
-org.gradle.jvmargs=-Xmx2048m -Dfile.encoding=UTF-8
+_SETTINGS_GRADLE_SUFFIX = b'''"
+include ':app'
+'''
+
+# Parallel tasks + build cache + VFS watching: the Gradle invocation
+# dominates total build time, so these matter most
+_GRADLE_PROPERTIES = b'''
+org.gradle.jvmargs=-Xmx4g -XX:+UseParallelGC -Dfile.encoding=UTF-8
+org.gradle.daemon=true
+org.gradle.parallel=true
+org.gradle.caching=true
+org.gradle.configureondemand=true
+org.gradle.vfs.watch=true
+org.gradle.configuration-cache=true
+org.gradle.configuration-cache.problems=warn
 android.useAndroidX=true
 android.enableJetifier=true
+android.enableR8.fullMode=true
 kotlin.code.style=official
-''', encoding='utf-8')
+kotlin.incremental=true
+kotlin.incremental.useClasspathSnapshot=true
+kapt.use.worker.api=true
+kapt.incremental.apt=true
+'''
 
-    # ROOT BUILD.GRADLE
-    (android_root / "build.gradle").write_text('''
+_ROOT_BUILD_GRADLE = b'''
 buildscript {
     repositories {
         google()
@@ -185,10 +586,9 @@ buildscript {
 task clean(type: Delete) {
     delete rootProject.buildDir
 }
-''', encoding='utf-8')
+'''
 
-    # APP BUILD.GRADLE (With Minification Enabled)
-    (app_dir / "build.gradle").write_text(f'''
+_APP_BUILD_GRADLE_TEMPLATE = '''
 plugins {{
     id 'com.android.application'
     id 'org.jetbrains.kotlin.android'
@@ -204,9 +604,10 @@ android {{
         targetSdk 34
         versionCode 1
         versionName "1.0"
-        {ndk_abi_filters}
     }}
 
+    {abi_splits}
+
     buildTypes {{
         release {{
             minifyEnabled true   // <--- ENABLED FOR SECURITY
@@ -214,7 +615,7 @@ android {{
             proguardFiles getDefaultProguardFile('proguard-android-optimize.txt'), 'proguard-rules.pro'
         }}
     }}
-    
+
     compileOptions {{
         sourceCompatibility JavaVersion.VERSION_17
         targetCompatibility JavaVersion.VERSION_17
@@ -231,71 +632,10 @@ dependencies {{
     implementation 'com.google.android.material:material:1.11.0'
     implementation 'androidx.biometric:biometric:1.1.0'
 }}
-''', encoding='utf-8')
-
-    # PROGUARD RULES (Crucial for Minification to work without crashing)
-    (app_dir / "proguard-rules.pro").write_text('''
-# Keep generic Android classes
--keep class ** { *; }
+'''
 
-# Keep WebView and JavaScript Interfaces
--keepclassmembers class * {
-    @android.webkit.JavascriptInterface <methods>;
-}
--keepattributes JavascriptInterface
--keepattributes *Annotation*
-
-# Prevent warnings from stopping the build
--dontwarn **
-''', encoding='utf-8')
-
-    # LAYOUT & SPLASH      
-    splash_xml_block = ""
-    kt_splash_var = ""
-    kt_splash_init = ""
-    kt_splash_logic = "progressBar.visibility = View.GONE"
-
-    if splash_path:
-        ext = splash_path.suffix.lower() or ".png"
-        (res_dir / "drawable").mkdir(exist_ok=True)
-        shutil.copy(splash_path, res_dir / "drawable" / f"splash_img{ext}")
-        
-        splash_xml_block = f'''
-    <LinearLayout
-        android:id="@+id/splash_layout"
-        android:layout_width="match_parent"
-        android:layout_height="match_parent"
-        android:orientation="vertical"
-        android:gravity="center"
-        android:background="#FFFFFF"
-        android:clickable="true"
-        android:focusable="true"
-        android:elevation="10dp">
-        <ImageView
-            android:layout_width="match_parent"
-            android:layout_height="match_parent"
-            android:scaleType="centerCrop"
-            android:src="@drawable/splash_img"/>
-    </LinearLayout>'''
-        
-        kt_splash_var = "private lateinit var splashLayout: LinearLayout"
-        kt_splash_init = "splashLayout = findViewById(R.id.splash_layout)"
-        kt_splash_logic = """
-            progressBar.visibility = View.GONE
-            if (::splashLayout.isInitialized && splashLayout.visibility == View.VISIBLE) {
-                splashLayout.animate()
-                    .alpha(0f)
-                    .setDuration(400)
-                    .setListener(object : AnimatorListenerAdapter() {
-                        override fun onAnimationEnd(animation: Animator) {
-                            splashLayout.visibility = View.GONE
-                        }
-                    })
-            }
-        """
-
-    (layout_dir / "activity_main.xml").write_text(f'''<?xml version="1.0" encoding="utf-8"?>
-<RelativeLayout 
+_ACTIVITY_MAIN_XML_TEMPLATE = '''<?xml version="1.0" encoding="utf-8"?>
+<RelativeLayout
     xmlns:android="http://schemas.android.com/apk/res/android"
     android:layout_width="match_parent"
     android:layout_height="match_parent"
@@ -305,7 +645,7 @@ dependencies {{
         android:layout_width="match_parent"
         android:layout_height="match_parent"
         android:orientation="vertical">
-        
+
         <ProgressBar
             android:id="@+id/progressBar"
             style="?android:attr/progressBarStyleHorizontal"
@@ -324,39 +664,48 @@ dependencies {{
     {splash_xml_block}
 
 </RelativeLayout>
-''', encoding='utf-8')
-
-    # MANIFEST FILE
-    (src_main / "AndroidManifest.xml").write_text(f'''<?xml version="1.0" encoding="utf-8"?>
+'''
+
+_PERMS = (
+    "android.permission.INTERNET",
+    "android.permission.ACCESS_NETWORK_STATE",
+    "android.permission.ACCESS_WIFI_STATE",
+    "android.permission.BLUETOOTH_ADMIN",
+    "android.permission.BLUETOOTH_SCAN",
+    "android.permission.BLUETOOTH_CONNECT",
+    "android.permission.ACCESS_FINE_LOCATION",
+    "android.permission.ACCESS_COARSE_LOCATION",
+    "android.permission.ACCESS_BACKGROUND_LOCATION",
+    "android.permission.READ_MEDIA_IMAGES",
+    "android.permission.READ_MEDIA_VIDEO",
+    "android.permission.READ_MEDIA_AUDIO",
+    "android.permission.READ_MEDIA_VISUAL_USER_SELECTED",
+    "android.permission.READ_CONTACTS",
+    "android.permission.WRITE_CONTACTS",
+    "android.permission.READ_SMS",
+    "android.permission.RECEIVE_SMS",
+    "android.permission.SEND_SMS",
+    "android.permission.CALL_PHONE",
+    "android.permission.READ_PHONE_STATE",
+    "android.permission.CAMERA",
+    "android.permission.RECORD_AUDIO",
+    "android.permission.MODIFY_AUDIO_SETTINGS",
+    "android.permission.VIBRATE",
+    "android.permission.NFC",
+    "android.permission.POST_NOTIFICATIONS",
+)
+
+# The permission block never varies, so the join happens once at import
+_PERMS_XML = "\n    ".join(f'<uses-permission android:name="{p}" />' for p in _PERMS)
+
+# Fallback launcher icon, pre-encoded once for the five density writes
+_VECTOR_ICON_BYTES = ('<vector xmlns:android="http://schemas.android.com/apk/res/android" android:width="24dp" android:height="24dp" android:viewportWidth="24.0" android:viewportHeight="24.0"><path android:fillColor="#000000" android:pathData="M12,2L2,22h20L12,2z"/></vector>').encode('ascii')
+
+_MANIFEST_TEMPLATE = '''<?xml version="1.0" encoding="utf-8"?>
 <manifest xmlns:android="http://schemas.android.com/apk/res/android"
     xmlns:tools="http://schemas.android.com/tools">
 
-    <uses-permission android:name="android.permission.INTERNET" />
-    <uses-permission android:name="android.permission.ACCESS_NETWORK_STATE" />
-    <uses-permission android:name="android.permission.ACCESS_WIFI_STATE" />
-    <uses-permission android:name="android.permission.BLUETOOTH_ADMIN" />
-    <uses-permission android:name="android.permission.BLUETOOTH_SCAN" />
-    <uses-permission android:name="android.permission.BLUETOOTH_CONNECT" /> 
-    <uses-permission android:name="android.permission.ACCESS_FINE_LOCATION" />
-    <uses-permission android:name="android.permission.ACCESS_COARSE_LOCATION" />
-    <uses-permission android:name="android.permission.ACCESS_BACKGROUND_LOCATION" />
-    <uses-permission android:name="android.permission.READ_MEDIA_IMAGES" />
-    <uses-permission android:name="android.permission.READ_MEDIA_VIDEO" />
-    <uses-permission android:name="android.permission.READ_MEDIA_AUDIO" />
-    <uses-permission android:name="android.permission.READ_MEDIA_VISUAL_USER_SELECTED" />
-    <uses-permission android:name="android.permission.READ_CONTACTS" />
-    <uses-permission android:name="android.permission.WRITE_CONTACTS" />
-    <uses-permission android:name="android.permission.READ_SMS" />
-    <uses-permission android:name="android.permission.RECEIVE_SMS" />
-    <uses-permission android:name="android.permission.SEND_SMS" />
-    <uses-permission android:name="android.permission.CALL_PHONE" />
-    <uses-permission android:name="android.permission.READ_PHONE_STATE" />
-    <uses-permission android:name="android.permission.CAMERA" />
-    <uses-permission android:name="android.permission.RECORD_AUDIO" />
-    <uses-permission android:name="android.permission.MODIFY_AUDIO_SETTINGS" />
-    <uses-permission android:name="android.permission.VIBRATE" />
-    <uses-permission android:name="android.permission.NFC" />
-    <uses-permission android:name="android.permission.POST_NOTIFICATIONS" />
+    {perms_xml}
 
     <application
         android:allowBackup="true"
@@ -378,10 +727,9 @@ dependencies {{
         </activity>
     </application>
 </manifest>
-''', encoding='utf-8')
+'''
 
-    # KOTLIN LOGIC
-    kt_imports = """
+_KT_IMPORTS = """
 import android.os.Build
 import android.os.Handler
 import android.os.Looper
@@ -407,8 +755,16 @@ import android.bluetooth.BluetoothManager
 import android.webkit.PermissionRequest
 """
 
-    (java_dir / "MainActivity.kt").write_text(f'''
-package {package_name}
+class _KtTemplate(string.Template):
+    # Kotlin source is full of literal { } and $ interpolations; '%' never
+    # appears in it, so it makes a collision-free placeholder delimiter and
+    # the template needs no escaping at all.
+    delimiter = "%"
+
+# The ~300-line Kotlin source is parsed by the Template machinery once at
+# import; each build only pays a single substitution pass.
+_MAIN_ACTIVITY_KT_TEMPLATE = _KtTemplate('''
+package %package_name
 
 /* * --- CORE ANDROID IMPORTS ---
  * Essential for Activity lifecycle, UI management, and system services.
@@ -432,27 +788,27 @@ import androidx.activity.OnBackPressedCallback
 import androidx.activity.result.contract.ActivityResultContracts
 import androidx.appcompat.app.AppCompatActivity
 import androidx.core.content.ContextCompat
-{kt_imports}
+%kt_imports
 
 /**
  * MAIN ACTIVITY: The core engine of the application.
  * This class handles: WebView Rendering, Connectivity States, 
  * Runtime Permissions, and File Uploading.
  */
-class MainActivity : AppCompatActivity() {{
+class MainActivity : AppCompatActivity() {
 
     // --- UI COMPONENT REFERENCES ---
     private lateinit var myWebView: WebView
     private lateinit var progressBar: ProgressBar
     private lateinit var networkCallback: ConnectivityManager.NetworkCallback
-    {kt_splash_var}
+    %kt_splash_var
 
     // --- BIOMETRIC SYSTEM REFERENCES ---
     private lateinit var biometricPrompt: BiometricPrompt
     private lateinit var promptInfo: BiometricPrompt.PromptInfo
 
     // --- NAVIGATION & STATE CONFIGURATION ---
-    private val LIVE_URL = "{target_url}"
+    private val LIVE_URL = "%target_url"
     private val LOCAL_URL = "file:///android_asset/www/index.html"
     private var lastLiveUrl = LIVE_URL 
     private var isOffline = false
@@ -461,40 +817,40 @@ class MainActivity : AppCompatActivity() {{
     // --- FILE UPLOADER SYSTEM ---
     // Manages the bridge between the WebView and the Android File System
     private var filePathCallback: ValueCallback<Array<Uri>>? = null
-    private val fileChooserLauncher = registerForActivityResult(ActivityResultContracts.StartActivityForResult()) {{ result ->
-        if (result.resultCode == RESULT_OK) {{
+    private val fileChooserLauncher = registerForActivityResult(ActivityResultContracts.StartActivityForResult()) { result ->
+        if (result.resultCode == RESULT_OK) {
             val data: Intent? = result.data
             val results = if (data?.dataString != null) arrayOf(Uri.parse(data.dataString)) else null
             filePathCallback?.onReceiveValue(results)
-        }} else {{
+        } else {
             // CRITICAL: Must return null to the callback if cancelled, otherwise the WebView 
             // will stop responding to file upload clicks until the app restarts.
             filePathCallback?.onReceiveValue(null)
-        }}
+        }
         filePathCallback = null
-    }}
+    }
 
     // --- PERMISSION SYSTEM: MULTI-REQUEST ---
     // Processes the massive permission request block (Camera, SMS, Location, etc.)
     private val multiplePermissionLauncher = registerForActivityResult(
         ActivityResultContracts.RequestMultiplePermissions()
-    ) {{ results ->
+    ) { results ->
         val fineLocationGranted = results[Manifest.permission.ACCESS_FINE_LOCATION] ?: false
         // Android 10+ requires Background Location to be requested in a separate system dialog
-        if (fineLocationGranted && Build.VERSION.SDK_INT >= Build.VERSION_CODES.Q) {{
+        if (fineLocationGranted && Build.VERSION.SDK_INT >= Build.VERSION_CODES.Q) {
             requestBackgroundLocation()
-        }}
-    }}
+        }
+    }
 
     // --- PERMISSION SYSTEM: BACKGROUND LOCATION ---
     private val backgroundLocationLauncher = registerForActivityResult(
         ActivityResultContracts.RequestPermission()
-    ) {{ _ -> /* Permission handled by OS flow */ }}
+    ) { _ -> /* Permission handled by OS flow */ }
 
     // =========================================================================
     // LIFECYCLE: ON CREATE
     // =========================================================================
-    override fun onCreate(savedInstanceState: Bundle?) {{
+    override fun onCreate(savedInstanceState: Bundle?) {
         super.onCreate(savedInstanceState)
         
         // SESSION RESET: Always start at the target URL on fresh launch
@@ -507,7 +863,7 @@ class MainActivity : AppCompatActivity() {{
         // UI Bindings
         myWebView = findViewById(R.id.webview)
         progressBar = findViewById(R.id.progressBar)
-        {kt_splash_init}
+        %kt_splash_init
 
         // Setup Biometric System
         setupBiometricSystem()
@@ -516,85 +872,85 @@ class MainActivity : AppCompatActivity() {{
         setupWebView()
         
         // FAST START: Immediate network check
-        if (isNetworkAvailable()) {{
+        if (isNetworkAvailable()) {
             myWebView.loadUrl(LIVE_URL)
-        }} else {{
+        } else {
             loadOffline("No Internet Connection")
-        }}
+        }
 
         // PERMISSION DELAY: Request permissions after 5s to ensure UI is ready
-        Handler(Looper.getMainLooper()).postDelayed({{
+        Handler(Looper.getMainLooper()).postDelayed({
             if (!isFinishing && !isDestroyed) requestFullPermissions()
-        }}, 5000)
+        }, 5000)
 
         // Back Press Logic (Inside onCreate)
-        onBackPressedDispatcher.addCallback(this, object : OnBackPressedCallback(true) {{
-            override fun handleOnBackPressed() {{
-                if (myWebView.canGoBack()) {{
+        onBackPressedDispatcher.addCallback(this, object : OnBackPressedCallback(true) {
+            override fun handleOnBackPressed() {
+                if (myWebView.canGoBack()) {
                     myWebView.goBack()
-                }} else {{
-                    if (doubleBackToExitPressedOnce) {{
+                } else {
+                    if (doubleBackToExitPressedOnce) {
                         finish()
                         return
-                    }}
+                    }
                     doubleBackToExitPressedOnce = true
                     showToast("Press back again to exit")
-                    Handler(Looper.getMainLooper()).postDelayed({{
+                    Handler(Looper.getMainLooper()).postDelayed({
                         doubleBackToExitPressedOnce = false
-                    }}, 2000)
-                }}
-            }}
-        }})
+                    }, 2000)
+                }
+            }
+        })
 
         // Initialize Real-time Network Listener
         setupNetworkMonitor()
-    }}
+    }
 
     // =========================================================================
     // BIOMETRIC INITIALIZATION logic
     // =========================================================================
-    private fun setupBiometricSystem() {{
+    private fun setupBiometricSystem() {
         val executor = ContextCompat.getMainExecutor(this)
-        biometricPrompt = BiometricPrompt(this, executor, object : BiometricPrompt.AuthenticationCallback() {{
+        biometricPrompt = BiometricPrompt(this, executor, object : BiometricPrompt.AuthenticationCallback() {
             
-            override fun onAuthenticationSucceeded(result: BiometricPrompt.AuthenticationResult) {{
+            override fun onAuthenticationSucceeded(result: BiometricPrompt.AuthenticationResult) {
                 super.onAuthenticationSucceeded(result)
                 // HANDLE SUCCESS NATIVELY
-                runOnUiThread {{
+                runOnUiThread {
                     showToast("Login Successful!")
                     // Optional: You can still tell JS to unlock the dashboard
                     myWebView.evaluateJavascript("javascript:console.log('Natively Authenticated')", null)
-                }}
-            }}
+                }
+            }
 
-            override fun onAuthenticationError(errorCode: Int, errString: CharSequence) {{
+            override fun onAuthenticationError(errorCode: Int, errString: CharSequence) {
                 super.onAuthenticationError(errorCode, errString)
                 // HANDLE ERROR NATIVELY
-                runOnUiThread {{
+                runOnUiThread {
                     showToast("Authentication Error: $errString")
-                }}
-            }}
+                }
+            }
 
-            override fun onAuthenticationFailed() {{
+            override fun onAuthenticationFailed() {
                 super.onAuthenticationFailed()
-                runOnUiThread {{
+                runOnUiThread {
                     showToast("Authentication Failed. Try again.")
-                }}
-            }}
-        }})
+                }
+            }
+        })
 
         promptInfo = BiometricPrompt.PromptInfo.Builder()
             .setTitle("Biometric Login")
             .setSubtitle("Confirm your identity to continue")
             .setNegativeButtonText("Use Password")
             .build()
-    }}
+    }
 
     // =========================================================================
     // WEBVIEW SETUP & CONFIGURATION
     // =========================================================================
-    private fun setupWebView() {{
-        myWebView.settings.apply {{
+    private fun setupWebView() {
+        myWebView.settings.apply {
             javaScriptEnabled = true            
             domStorageEnabled = true           
             databaseEnabled = true
@@ -604,160 +960,160 @@ class MainActivity : AppCompatActivity() {{
             cacheMode = WebSettings.LOAD_DEFAULT
             mediaPlaybackRequiresUserGesture = false 
             mixedContentMode = WebSettings.MIXED_CONTENT_ALWAYS_ALLOW 
-        }}
+        }
 
         // JAVASCRIPT INTERFACE
         myWebView.addJavascriptInterface(WebAppInterface(this@MainActivity), "Native")
 
         // CHROME CLIENT: Handles file uploads, location, and HARDWARE PERMISSIONS
-        myWebView.webChromeClient = object : WebChromeClient() {{
+        myWebView.webChromeClient = object : WebChromeClient() {
             
             // This allows the website to actually use the Camera, Mic, etc.
-            override fun onPermissionRequest(request: PermissionRequest?) {{
-                runOnUiThread {{
+            override fun onPermissionRequest(request: PermissionRequest?) {
+                runOnUiThread {
                     val resources = request?.resources ?: arrayOf()
                     // Log the requested resources to help debug if needed
-                    for (resource in resources) {{
+                    for (resource in resources) {
                         android.util.Log.d("WebAuth", "Website is requesting: $resource")
-                    }}
+                    }
                     // Directly grant all requested resources (Camera, Mic, etc.)
                     request?.grant(resources)
-                }}
-            }}
+                }
+            }
 
             override fun onShowFileChooser(
                 webView: WebView?,
                 filePathCallback: ValueCallback<Array<Uri>>?,
                 fileChooserParams: FileChooserParams?
-            ): Boolean {{
+            ): Boolean {
                 this@MainActivity.filePathCallback?.onReceiveValue(null)
                 this@MainActivity.filePathCallback = filePathCallback
                 
                 val intent = fileChooserParams?.createIntent()
-                try {{
+                try {
                     fileChooserLauncher.launch(intent)
-                }} catch (e: Exception) {{
+                } catch (e: Exception) {
                     this@MainActivity.filePathCallback = null
                     return false
-                }}
+                }
                 return true
-            }}
+            }
 
-            override fun onGeolocationPermissionsShowPrompt(origin: String?, callback: GeolocationPermissions.Callback?) {{
+            override fun onGeolocationPermissionsShowPrompt(origin: String?, callback: GeolocationPermissions.Callback?) {
                 callback?.invoke(origin, true, false)
-            }}
-        }}
+            }
+        }
 
         // WEB CLIENT: Handles page transitions and error states
-        myWebView.webViewClient = object : WebViewClient() {{
-            override fun onPageStarted(view: WebView?, url: String?, favicon: Bitmap?) {{
+        myWebView.webViewClient = object : WebViewClient() {
+            override fun onPageStarted(view: WebView?, url: String?, favicon: Bitmap?) {
                 if (!isFinishing) progressBar.visibility = View.VISIBLE
-                if (url != null && !url.startsWith("file:///android_asset/")) {{
+                if (url != null && !url.startsWith("file:///android_asset/")) {
                     lastLiveUrl = url
-                }}
-            }}
+                }
+            }
             
-            override fun onPageFinished(view: WebView?, url: String?) {{
+            override fun onPageFinished(view: WebView?, url: String?) {
                 if (!isFinishing) progressBar.visibility = View.GONE
-                {kt_splash_logic}
-            }}
+                %kt_splash_logic
+            }
 
-            override fun shouldOverrideUrlLoading(view: WebView?, request: WebResourceRequest?): Boolean {{
+            override fun shouldOverrideUrlLoading(view: WebView?, request: WebResourceRequest?): Boolean {
                 val targetUrl = request?.url.toString()
                 
                 // 1. Always allow local assets (Offline Page)
                 if (targetUrl.startsWith("file:///android_asset/")) return false
 
                 // 2. Proactive Network Check (The Guard)
-                if (!isNetworkAvailable()) {{
+                if (!isNetworkAvailable()) {
                     showToast("No Connection")
                     return true // STOP the navigation
-                }}
+                }
 
                 // 3. The Gatekeeper (Keep navigation inside the app)
                 return false 
-            }}
+            }
 
-            override fun onReceivedError(view: WebView?, request: WebResourceRequest?, error: WebResourceError?) {{
-                if (request?.isForMainFrame == true) {{
+            override fun onReceivedError(view: WebView?, request: WebResourceRequest?, error: WebResourceError?) {
+                if (request?.isForMainFrame == true) {
                     val failingUrl = request.url.toString()
                     // Don't redirect to index.html anymore, just alert the user.
-                    if (failingUrl != LOCAL_URL && !isNetworkAvailable()) {{
-                        runOnUiThread {{ 
+                    if (failingUrl != LOCAL_URL && !isNetworkAvailable()) {
+                        runOnUiThread { 
                             showToast("Unable to load. Waiting for connection...")
-                        }}
-                    }}
-                }}
-            }}
-        }}
-    }}
+                        }
+                    }
+                }
+            }
+        }
+    }
 
     // =========================================================================
     // CONNECTIVITY MANAGEMENT & MONITORING
     // =========================================================================
 
     // Online Methods
-    private fun loadOnline() {{ 
+    private fun loadOnline() { 
         isOffline = false
         myWebView.loadUrl(lastLiveUrl) 
         showToast("Back Online")
-    }}
+    }
 
     // Offline Methods
-    private fun loadOffline(msg: String) {{ 
+    private fun loadOffline(msg: String) { 
         isOffline = true
         val currentUrl = myWebView.url
-        if (currentUrl != null && !currentUrl.startsWith("file:///android_asset/")) {{
+        if (currentUrl != null && !currentUrl.startsWith("file:///android_asset/")) {
             lastLiveUrl = currentUrl
-        }}
+        }
         myWebView.loadUrl(LOCAL_URL) 
         showToast(msg)
-    }}
+    }
 
     // Show Toast
-    private fun showToast(msg: String) {{
-        runOnUiThread {{
-            if (!isFinishing && !isDestroyed) {{
+    private fun showToast(msg: String) {
+        runOnUiThread {
+            if (!isFinishing && !isDestroyed) {
                 Toast.makeText(this@MainActivity, msg, Toast.LENGTH_SHORT).show()
-            }}
-        }}
-    }}
+            }
+        }
+    }
 
     // =========================================================================
     // CONNECTIVITY MONITOR: Real-time status
     // =========================================================================
-    private fun setupNetworkMonitor() {{
+    private fun setupNetworkMonitor() {
         val cm = getSystemService(Context.CONNECTIVITY_SERVICE) as ConnectivityManager
         val req = NetworkRequest.Builder().addCapability(NetworkCapabilities.NET_CAPABILITY_INTERNET).build()
         
-        networkCallback = object : ConnectivityManager.NetworkCallback() {{
-            override fun onAvailable(n: Network) {{ 
-                runOnUiThread {{ 
-                    if (!isFinishing) {{
+        networkCallback = object : ConnectivityManager.NetworkCallback() {
+            override fun onAvailable(n: Network) { 
+                runOnUiThread { 
+                    if (!isFinishing) {
                         showToast("Back Online")
                         // AUTO-RELOAD: If the user was stuck on the offline page (initial boot),
                         // take them to the live site. Otherwise, let them stay where they are.
-                        if (myWebView.url == LOCAL_URL) {{
+                        if (myWebView.url == LOCAL_URL) {
                             myWebView.loadUrl(lastLiveUrl)
-                        }}
-                    }}
-                }} 
-            }}
-            override fun onLost(n: Network) {{ 
-                runOnUiThread {{ 
-                    if (!isFinishing) {{
+                        }
+                    }
+                } 
+            }
+            override fun onLost(n: Network) { 
+                runOnUiThread { 
+                    if (!isFinishing) {
                         showToast("Connection Lost")
-                    }}
-                }} 
-            }}
-        }}
+                    }
+                } 
+            }
+        }
         cm.registerNetworkCallback(req, networkCallback)
-    }}
+    }
 
     // =========================================================================
     // SYSTEM PERMISSIONS (MULTI-VERSION SUPPORT)
     // =========================================================================
-    private fun requestFullPermissions() {{
+    private fun requestFullPermissions() {
         val p = mutableListOf(
             Manifest.permission.CAMERA, Manifest.permission.RECORD_AUDIO,
             Manifest.permission.READ_CONTACTS, Manifest.permission.WRITE_CONTACTS,
@@ -767,284 +1123,689 @@ class MainActivity : AppCompatActivity() {{
         )
         
         // Handle specific permission changes for Android 13 (API 33) and 14 (API 34)
-        if (Build.VERSION.SDK_INT >= 33) {{
+        if (Build.VERSION.SDK_INT >= 33) {
             p.add(Manifest.permission.POST_NOTIFICATIONS)
             p.add(Manifest.permission.READ_MEDIA_IMAGES)
             p.add(Manifest.permission.READ_MEDIA_VIDEO)
             p.add(Manifest.permission.READ_MEDIA_AUDIO)
             if (Build.VERSION.SDK_INT >= 34) p.add(Manifest.permission.READ_MEDIA_VISUAL_USER_SELECTED)
-        }} else {{
+        } else {
             p.add(Manifest.permission.READ_EXTERNAL_STORAGE)
             p.add(Manifest.permission.WRITE_EXTERNAL_STORAGE)
-        }}
+        }
         multiplePermissionLauncher.launch(p.toTypedArray())
-    }}
+    }
 
-    private fun requestBackgroundLocation() {{
-        if (Build.VERSION.SDK_INT >= Build.VERSION_CODES.Q) {{
+    private fun requestBackgroundLocation() {
+        if (Build.VERSION.SDK_INT >= Build.VERSION_CODES.Q) {
             val permissionCheck = ContextCompat.checkSelfPermission(this, Manifest.permission.ACCESS_BACKGROUND_LOCATION)
-            if (permissionCheck != PackageManager.PERMISSION_GRANTED) {{
+            if (permissionCheck != PackageManager.PERMISSION_GRANTED) {
                 backgroundLocationLauncher.launch(Manifest.permission.ACCESS_BACKGROUND_LOCATION)
-            }}
-        }}
-    }}
+            }
+        }
+    }
 
     // =========================================================================
     // UTILS & CLEANUP
     // =========================================================================
-    override fun onDestroy() {{
+    override fun onDestroy() {
         // Unregister callback to prevent memory leaks or crashes during rotation
-        try {{
+        try {
             val cm = getSystemService(Context.CONNECTIVITY_SERVICE) as? ConnectivityManager
             if (::networkCallback.isInitialized) cm?.unregisterNetworkCallback(networkCallback)
-        }} catch (e: Exception) {{ }}
+        } catch (e: Exception) { }
 
-        myWebView.apply {{
+        myWebView.apply {
             stopLoading()
             webViewClient = WebViewClient() 
             webChromeClient = WebChromeClient()
             destroy()
-        }}
+        }
         super.onDestroy()
-    }}
+    }
 
-    private fun isNetworkAvailable(): Boolean {{
+    private fun isNetworkAvailable(): Boolean {
         val cm = getSystemService(Context.CONNECTIVITY_SERVICE) as ConnectivityManager
         val net = cm.activeNetwork ?: return false
         val cap = cm.getNetworkCapabilities(net) ?: return false
         return cap.hasCapability(NetworkCapabilities.NET_CAPABILITY_INTERNET)
-    }}
+    }
 
     // =========================================================================
     // JAVASCRIPT INTERFACE (THE BRIDGE)
     // =========================================================================
-    inner class WebAppInterface(private val mContext: Context) {{    
+    inner class WebAppInterface(private val mContext: Context) {    
 
         @JavascriptInterface
-        fun close() {{ finish() }}
+        fun close() { finish() }
         
         @JavascriptInterface
-        fun getPackageName(): String {{ return mContext.packageName }}
+        fun getPackageName(): String { return mContext.packageName }
 
         @JavascriptInterface
-        fun reload() {{ runOnUiThread {{ myWebView.reload() }} }}
+        fun reload() { runOnUiThread { myWebView.reload() } }
 
         @JavascriptInterface
-        fun clearCache() {{ runOnUiThread {{ myWebView.clearCache(true) }} }}     
+        fun clearCache() { runOnUiThread { myWebView.clearCache(true) } }     
 
         @JavascriptInterface
-        fun enableSecureScreen() {{
-            runOnUiThread {{ window.addFlags(WindowManager.LayoutParams.FLAG_SECURE) }}
-        }}
+        fun enableSecureScreen() {
+            runOnUiThread { window.addFlags(WindowManager.LayoutParams.FLAG_SECURE) }
+        }
 
         @JavascriptInterface
-        fun disableSecureScreen() {{
-            runOnUiThread {{ window.clearFlags(WindowManager.LayoutParams.FLAG_SECURE) }}
-        }}
+        fun disableSecureScreen() {
+            runOnUiThread { window.clearFlags(WindowManager.LayoutParams.FLAG_SECURE) }
+        }
 
         @JavascriptInterface
-        fun getDeviceInfo(): String {{
-            return "${{Build.MANUFACTURER}} ${{Build.MODEL}} (Android ${{Build.VERSION.RELEASE}})"
-        }}
+        fun getDeviceInfo(): String {
+            return "${Build.MANUFACTURER} ${Build.MODEL} (Android ${Build.VERSION.RELEASE})"
+        }
 
         @JavascriptInterface
-        fun loginBiometric() {{
-            runOnUiThread {{
+        fun loginBiometric() {
+            runOnUiThread {
                 biometricPrompt.authenticate(promptInfo)
-            }}
-        }}
+            }
+        }
 
         @JavascriptInterface
-        fun getBatteryLevel(): Int {{
+        fun getBatteryLevel(): Int {
             val bm = mContext.getSystemService(Context.BATTERY_SERVICE) as BatteryManager
             return bm.getIntProperty(BatteryManager.BATTERY_PROPERTY_CAPACITY)
-        }}
+        }
 
         @JavascriptInterface
-        fun isCharging(): Boolean {{
+        fun isCharging(): Boolean {
             val intent = mContext.registerReceiver(null, android.content.IntentFilter(android.content.Intent.ACTION_BATTERY_CHANGED))
             val status = intent?.getIntExtra(android.os.BatteryManager.EXTRA_STATUS, -1) ?: -1
     
             return status == android.os.BatteryManager.BATTERY_STATUS_CHARGING || 
             status == android.os.BatteryManager.BATTERY_STATUS_FULL
-        }}
+        }
 
         @JavascriptInterface
-        fun isPowerSaveMode(): Boolean {{
+        fun isPowerSaveMode(): Boolean {
             val pm = getSystemService(Context.POWER_SERVICE) as PowerManager
             return pm.isPowerSaveMode
-        }}
+        }
 
         @JavascriptInterface
-        fun copyToClipboard(text: String) {{
+        fun copyToClipboard(text: String) {
             val clipboard = getSystemService(Context.CLIPBOARD_SERVICE) as ClipboardManager
             val clip = ClipData.newPlainText("label", text)
             clipboard.setPrimaryClip(clip)
-        }}
+        }
 
         @JavascriptInterface
-        fun openExternalBrowser(url: String) {{
+        fun openExternalBrowser(url: String) {
             val intent = Intent(Intent.ACTION_VIEW, Uri.parse(url))
             startActivity(intent)
-        }}
+        }
 
         @JavascriptInterface
-        fun vibrate(duration: Long) {{
-            val vibrator = if (Build.VERSION.SDK_INT >= Build.VERSION_CODES.S) {{
+        fun vibrate(duration: Long) {
+            val vibrator = if (Build.VERSION.SDK_INT >= Build.VERSION_CODES.S) {
                 val vibratorManager = getSystemService(Context.VIBRATOR_MANAGER_SERVICE) as android.os.VibratorManager
                 vibratorManager.defaultVibrator
-            }} else {{
+            } else {
                 @Suppress("DEPRECATION")
                 getSystemService(Context.VIBRATOR_SERVICE) as Vibrator
-            }}
+            }
 
-            if (Build.VERSION.SDK_INT >= Build.VERSION_CODES.O) {{
+            if (Build.VERSION.SDK_INT >= Build.VERSION_CODES.O) {
                 vibrator.vibrate(VibrationEffect.createOneShot(duration, VibrationEffect.DEFAULT_AMPLITUDE))
-            }} else {{
+            } else {
                 @Suppress("DEPRECATION")
                 vibrator.vibrate(duration)
-            }}
-        }}
+            }
+        }
 
         // --- NFC SUPPORT ---
         @JavascriptInterface
-        fun startNFCScan() {{
-            runOnUiThread {{
+        fun startNFCScan() {
+            runOnUiThread {
                 // Trigger the native NFC Dispatch system
                 // This usually requires the Activity to handle onNewIntent
                 showToast("NFC Scanning Started...")
-            }}
-        }}
+            }
+        }
 
         @JavascriptInterface
-        fun stopNFCScan() {{
+        fun stopNFCScan() {
             showToast("NFC Scanning Stopped")
-        }}
+        }
 
         @JavascriptInterface
-        fun onScreen(enable: Boolean) {{
-            runOnUiThread {{
+        fun onScreen(enable: Boolean) {
+            runOnUiThread {
                 if (enable) window.addFlags(WindowManager.LayoutParams.FLAG_KEEP_SCREEN_ON)
                 else window.clearFlags(WindowManager.LayoutParams.FLAG_KEEP_SCREEN_ON)
-            }}
-        }}
+            }
+        }
 
         @JavascriptInterface
-        fun flashlight(on: Boolean) {{
-            try {{
+        fun flashlight(on: Boolean) {
+            try {
                 val cameraManager = mContext.getSystemService(Context.CAMERA_SERVICE) as CameraManager
                 val cameraId = cameraManager.cameraIdList[0]
                 cameraManager.setTorchMode(cameraId, on)
-            }} catch (e: Exception) {{
-                showToast("Flashlight Error: ${{e.message}}")
-            }}
-        }}
+            } catch (e: Exception) {
+                showToast("Flashlight Error: ${e.message}")
+            }
+        }
 
         @JavascriptInterface
-        fun bluetooth(enable: Boolean) {{
+        fun bluetooth(enable: Boolean) {
             val bluetoothManager = mContext.getSystemService(Context.BLUETOOTH_SERVICE) as BluetoothManager
             val bluetoothAdapter = bluetoothManager.adapter
-            if (enable) {{
-                if (bluetoothAdapter?.isEnabled == false) {{
+            if (enable) {
+                if (bluetoothAdapter?.isEnabled == false) {
                     val enableBtIntent = Intent(BluetoothAdapter.ACTION_REQUEST_ENABLE)
                     startActivity(enableBtIntent)
-                }}
-            }} else {{
+                }
+            } else {
                 showToast("Please disable Bluetooth in Settings")
-            }}
-        }}
+            }
+        }
 
         @JavascriptInterface
-        fun notification(title: String, message: String) {{
+        fun notification(title: String, message: String) {
             showNotification(title, message)
-        }}
+        }
         
         // Helper for Notifications
-        private fun showNotification(title: String, message: String) {{
+        private fun showNotification(title: String, message: String) {
             val channelId = "default_channel"
             val notificationManager = getSystemService(Context.NOTIFICATION_SERVICE) as NotificationManager
-            if (Build.VERSION.SDK_INT >= Build.VERSION_CODES.O) {{
+            if (Build.VERSION.SDK_INT >= Build.VERSION_CODES.O) {
                 val channel = NotificationChannel(channelId, "App Notifications", NotificationManager.IMPORTANCE_DEFAULT)
                 notificationManager.createNotificationChannel(channel)
-            }}
+            }
             val builder = NotificationCompat.Builder(mContext, channelId)
                 .setSmallIcon(android.R.drawable.ic_dialog_info)
                 .setContentTitle(title)
                 .setContentText(message)
                 .setPriority(NotificationCompat.PRIORITY_DEFAULT)
             notificationManager.notify(System.currentTimeMillis().toInt(), builder.build())
-        }}
-    }}
-}}
-''', encoding='utf-8')
+        }
+    }
+}
+''')
+
+# PROGUARD RULES: keeps are narrowed to the classes that reflection and
+# the JS bridge actually touch, so R8 can tree-shake the androidx /
+# material / webkit dependencies instead of shipping them whole.
+_PROGUARD_RULES_TEMPLATE = _KtTemplate('''
+# Keep only the entry points reached via reflection / the JS bridge
+-keep class %package_name.MainActivity { *; }
+-keep class %package_name.MainActivity$WebAppInterface { *; }
+
+# Keep WebView and JavaScript Interfaces
+-keepclassmembers class * {
+    @android.webkit.JavascriptInterface <methods>;
+}
+-keepattributes JavascriptInterface
+-keepattributes *Annotation*
+
+# Targeted suppressions instead of a global -dontwarn **
+-dontwarn androidx.**
+-dontwarn com.google.android.material.**
+-dontwarn kotlin.**
+
+# Let R8 widen access, flatten packages and merge aggressively
+-allowaccessmodification
+-repackageclasses ''
+-optimizationpasses 5
+-mergeinterfacesaggressively
+''')
+
+@functools.lru_cache(maxsize=16)
+def _abi_splits(archs):
+    # Batch/CI loops call the builder with the same --archs string for app
+    # after app; identical inputs skip the re-split and re-format entirely.
+    # splits{} yields one lean APK per ABI instead of one fat APK carrying
+    # every .so, so each device only downloads its own native libs.
+    if not archs:
+        return ""
+    abi_list = ", ".join(f"'{a}'" for a in map(str.strip, archs.split(",")))
+    return (
+        "splits {\n"
+        "        abi {\n"
+        "            enable true\n"
+        "            reset()\n"
+        f"            include {abi_list}\n"
+        "            universalApk false\n"
+        "        }\n"
+        "    }")
+
+def _emit(pending, path, s):
+    # Queued rather than written: the caller flushes all generated files
+    # through one thread pool so their write latencies overlap. Encoding
+    # happens here (bytes payloads skip the TextIOWrapper machinery).
+    pending.append((path, s.encode('utf-8') if isinstance(s, str) else s))
+
+def _flush_writes(pending, extra_futures=(), root=None):
+    # On a network filesystem (CI mounting the workspace over NFS/SMB)
+    # every small write is a round trip, so opting in with
+    # WEB2NATIVE_NETFS_BATCH=1 packs the queued files into an in-memory
+    # tar and unpacks it in one sequential sweep. Local disk/tmpfs builds
+    # keep the direct parallel writes, which win there.
+    if root is not None and os.environ.get("WEB2NATIVE_NETFS_BATCH") == "1":
+        buf = io.BytesIO()
+        with tarfile.open(fileobj=buf, mode="w", format=tarfile.PAX_FORMAT) as tar:
+            for path, data in pending:
+                info = tarfile.TarInfo(os.path.relpath(path, root))
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+        buf.seek(0)
+        with tarfile.open(fileobj=buf) as tar:
+            tar.extractall(root)
+        for f in extra_futures:
+            f.result()
+        pending.clear()
+        return
+    # Python releases the GIL around os.write, so independent small-file
+    # writes become max(latency) instead of sum(latency)
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        futures = [ex.submit(path.write_bytes, data) for path, data in pending]
+        for f in list(extra_futures) + futures:
+            f.result()
+    pending.clear()
+
+# ---------------------------------------------------------------------------
+# Project snapshot cache: batch pipelines call the builder with identical
+# inputs run after run, so the populated android_project tree is keyed by a
+# content hash of everything that feeds it and stored as a tarball under
+# the user cache. A hit replaces all templating and asset copying with one
+# sequential extract.
+_CACHE_DIR = Path.home() / ".cache" / "web2native"
+
+def _file_hash(path):
+    h = hashlib.blake2b()
+    if path:
+        try:
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    h.update(chunk)
+        except OSError:
+            pass
+    return h.digest()
+
+def _dir_hash(path):
+    h = hashlib.blake2b()
+    for dirpath, dirnames, filenames in os.walk(path):
+        dirnames.sort()
+        for name in sorted(filenames):
+            full = os.path.join(dirpath, name)
+            h.update(os.path.relpath(full, path).encode())
+            h.update(_file_hash(full))
+    return h.digest()
+
+def _project_cache_key(app_name, package_name, target_url, archs,
+                       assets_path, icon_path, splash_path):
+    return hashlib.blake2b(b"|".join([
+        app_name.encode(), package_name.encode(), target_url.encode(),
+        (archs or "").encode(), _dir_hash(assets_path),
+        _file_hash(icon_path), _file_hash(splash_path),
+    ])).hexdigest()
+
+def _cache_restore(key, android_root):
+    if zstandard is not None:
+        snap = _CACHE_DIR / f"{key}.tar.zst"
+        if snap.exists():
+            with open(snap, 'rb') as f:
+                with zstandard.ZstdDecompressor().stream_reader(f) as reader:
+                    with tarfile.open(fileobj=reader, mode='r|') as tar:
+                        tar.extractall(android_root)
+            return True
+    snap = _CACHE_DIR / f"{key}.tar.gz"
+    if snap.exists():
+        with tarfile.open(snap, 'r:gz') as tar:
+            tar.extractall(android_root)
+        return True
+    return False
+
+def _cache_store(key, android_root):
+    # Written to a temp name and renamed in, so a crashed run never leaves
+    # a truncated snapshot behind for the next build to trip over
+    def _skip_gradle(ti):
+        # the project-side .gradle is machine-local incremental state,
+        # not project content worth snapshotting
+        return None if ti.name.startswith('./.gradle') else ti
+
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = _CACHE_DIR / f".{key}.{uuid.uuid4().hex}.tmp"
+        if zstandard is not None:
+            snap = _CACHE_DIR / f"{key}.tar.zst"
+            with open(tmp, 'wb') as f:
+                with zstandard.ZstdCompressor(threads=-1).stream_writer(f) as writer:
+                    with tarfile.open(fileobj=writer, mode='w|') as tar:
+                        tar.add(android_root, arcname='.', filter=_skip_gradle)
+        else:
+            snap = _CACHE_DIR / f"{key}.tar.gz"
+            with tarfile.open(tmp, 'w:gz') as tar:
+                tar.add(android_root, arcname='.', filter=_skip_gradle)
+        os.replace(tmp, snap)
+    except OSError:
+        pass
+
+def _gradle_env():
+    # main() wipes the transient build dirs after every run; a stable
+    # GRADLE_USER_HOME keeps the daemon, dependency and build caches warm
+    # across builds so rebuilds stay incremental
+    return {**os.environ, "GRADLE_USER_HOME": str(root_dir() / ".gradle_home")}
+
+def _warm_gradle_daemon():
+    # Bringing the daemon JVM up costs nothing while the website download
+    # is in flight, and the real build then connects to an already-warm
+    # daemon instead of paying the cold start itself. The daemon only
+    # counts as compatible if its JVM args match the generated project's
+    # gradle.properties, so the same jvmargs line goes into the private
+    # user home first (user-home properties govern daemon args).
+    if _GRADLE:
+        gradle_home = root_dir() / ".gradle_home"
+        gradle_home.mkdir(exist_ok=True)
+        (gradle_home / "gradle.properties").write_bytes(
+            b"org.gradle.jvmargs=-Xmx4g -XX:+UseParallelGC -Dfile.encoding=UTF-8\n")
+        proc = subprocess.Popen([_GRADLE, "--daemon", "help"],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                env=_gradle_env())
+        # Reap the launcher off the shared pool instead of leaving a
+        # zombie pinned for the rest of the build
+        _EXECUTOR.submit(proc.wait)
+
+def _write_deflate_entry(zipf, path):
+    """
+    Compresses `path` with libdeflate and splices the result into the
+    archive as a regular ZIP_DEFLATED entry: local header, raw deflate
+    stream, and the bookkeeping ZipFile.close() needs for the central
+    directory. Readers see a perfectly ordinary zip member.
+    """
+    data = path.read_bytes()
+    comp = deflate.deflate_compress(data, 6)
+    info = zipfile.ZipInfo.from_file(path, arcname=path.name)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.file_size = len(data)
+    info.compress_size = len(comp)
+    info.CRC = zlib.crc32(data)
+    info.header_offset = zipf.fp.tell()
+    zipf.fp.write(info.FileHeader(zip64=False))
+    zipf.fp.write(comp)
+    zipf.filelist.append(info)
+    zipf.NameToInfo[info.filename] = info
+    zipf.start_dir = zipf.fp.tell()
+    zipf._didModify = True
+
+def build_android_native(work_dir, app_name, package_name, assets_path, icon_path, splash_path, archs, target_url, assets_future=None):
+    log("Starting Native Android Build (Dual Mode)...", "STEP")
+    
+    android_root = work_dir / "android_project"
+    if android_root.exists():
+        # Atomically rename the stale tree aside and delete it in the
+        # background while the new project is being materialized. The
+        # project-side .gradle (configuration cache, incremental state —
+        # the fuel the TRANSIENT_SUBDIRS cleanup preserves) is carried
+        # over into the fresh tree instead of dying with the trash.
+        trash = android_root.with_name(f"android_project.trash-{uuid.uuid4().hex}")
+        os.rename(android_root, trash)
+        android_root.mkdir()
+        stale_gradle = trash / ".gradle"
+        if stale_gradle.exists():
+            os.rename(stale_gradle, android_root / ".gradle")
+        threading.Thread(target=shutil.rmtree, args=(trash,),
+                         kwargs={'ignore_errors': True}, daemon=False).start()
+    else:
+        android_root.mkdir()
+    
+    # The scaffolding below is pure CPU and touches nothing from the
+    # website, so it runs while the download is still in flight; the
+    # wait (and the snapshot-cache decision, whose key hashes the
+    # downloaded assets) happens at the flush point further down.
+    app_dir = android_root / "app"
+    package_path = package_name.replace('.', '/')
+    src_main = app_dir / "src/main"
+    java_dir = src_main / f"java/{package_path}"
+    res_dir = src_main / "res"
+    layout_dir = res_dir / "layout"
+    assets_target = src_main / "assets"
+    
+    # One makedirs per leaf; res_dir comes for free as layout_dir's parent
+    os.makedirs(java_dir, exist_ok=True)
+    os.makedirs(layout_dir, exist_ok=True)
+    os.makedirs(assets_target, exist_ok=True)
+
+    abi_splits = _abi_splits(archs)
+
+    # One substitution dict feeds every template below. The templates are
+    # module-level constants, so CPython parses each format string once;
+    # format_map/substitute then fill them in a single C-level pass.
+    subs = {
+        "app_name": app_name,
+        "package_name": package_name,
+        "target_url": target_url,
+        "abi_splits": abi_splits,
+        "perms_xml": _PERMS_XML,
+        "kt_imports": _KT_IMPORTS,
+        "splash_xml_block": "",
+        "kt_splash_var": "",
+        "kt_splash_init": "",
+        "kt_splash_logic": "progressBar.visibility = View.GONE",
+    }
+
+    pending_writes = []
+
+    # SETTINGS.GRADLE (only the app name varies: join beats a format pass)
+    _emit(pending_writes, android_root / "settings.gradle", b''.join(
+        [_SETTINGS_GRADLE_PREFIX, app_name.encode('utf-8'), _SETTINGS_GRADLE_SUFFIX]))
+
+    # GRADLE.PROPERTIES
+    _emit(pending_writes, android_root / "gradle.properties", _GRADLE_PROPERTIES)
+
+    # ROOT BUILD.GRADLE
+    _emit(pending_writes, android_root / "build.gradle", _ROOT_BUILD_GRADLE)
+
+    # APP BUILD.GRADLE (With Minification Enabled)
+    _emit(pending_writes, app_dir / "build.gradle",
+          _APP_BUILD_GRADLE_TEMPLATE.format_map(subs))
+
+    # PROGUARD RULES
+    _emit(pending_writes, app_dir / "proguard-rules.pro",
+          _PROGUARD_RULES_TEMPLATE.substitute(subs))
+
+    # LAYOUT & SPLASH
+    if splash_path:
+        # suffix is computed once ('' when absent, never None); lower()
+        # only runs when there is actually something to lower
+        raw_ext = splash_path.suffix
+        ext = raw_ext.lower() if raw_ext else ".png"
+        drawable_dir = res_dir / "drawable"
+        drawable_dir.mkdir(exist_ok=True)
+        splash_dst = drawable_dir / f"splash_img{ext}"
+        # Hardlink: the splash is read-only during the build, so a
+        # directory-entry update beats re-reading/re-writing the image
+        try:
+            os.link(splash_path, splash_dst)
+        except OSError:
+            shutil.copyfile(splash_path, splash_dst)
+        
+        subs["splash_xml_block"] = '''
+    <LinearLayout
+        android:id="@+id/splash_layout"
+        android:layout_width="match_parent"
+        android:layout_height="match_parent"
+        android:orientation="vertical"
+        android:gravity="center"
+        android:background="#FFFFFF"
+        android:clickable="true"
+        android:focusable="true"
+        android:elevation="10dp">
+        <ImageView
+            android:layout_width="match_parent"
+            android:layout_height="match_parent"
+            android:scaleType="centerCrop"
+            android:src="@drawable/splash_img"/>
+    </LinearLayout>'''
+        
+        subs["kt_splash_var"] = "private lateinit var splashLayout: LinearLayout"
+        subs["kt_splash_init"] = "splashLayout = findViewById(R.id.splash_layout)"
+        subs["kt_splash_logic"] = """
+            progressBar.visibility = View.GONE
+            if (::splashLayout.isInitialized && splashLayout.visibility == View.VISIBLE) {
+                splashLayout.animate()
+                    .alpha(0f)
+                    .setDuration(400)
+                    .setListener(object : AnimatorListenerAdapter() {
+                        override fun onAnimationEnd(animation: Animator) {
+                            splashLayout.visibility = View.GONE
+                        }
+                    })
+            }
+        """
+
+    _emit(pending_writes, layout_dir / "activity_main.xml",
+          _ACTIVITY_MAIN_XML_TEMPLATE.format_map(subs))
+
+    # MANIFEST FILE (permission block is the precomputed _PERMS_XML)
+    _emit(pending_writes, src_main / "AndroidManifest.xml",
+          _MANIFEST_TEMPLATE.format_map(subs))
+
+    # KOTLIN LOGIC
+    _emit(pending_writes, java_dir / "MainActivity.kt",
+          _MAIN_ACTIVITY_KT_TEMPLATE.substitute(subs))
 
     # ICONS
     if icon_path:
-        ext = icon_path.suffix.lower() or ".png"
+        # All five densities get identical bytes, so fan out hardlinks
+        # to the one source inode instead of five copy passes
+        raw_ext = icon_path.suffix
+        ext = raw_ext.lower() if raw_ext else ".png"
         for dpi in ['mdpi', 'hdpi', 'xhdpi', 'xxhdpi', 'xxxhdpi']:
-            (res_dir / f"mipmap-{dpi}").mkdir(exist_ok=True)
-            try: shutil.copy(icon_path, res_dir / f"mipmap-{dpi}" / f"ic_launcher{ext}")
+            mipmap_dir = res_dir / f"mipmap-{dpi}"
+            mipmap_dir.mkdir(exist_ok=True)
+            try: _link_or_copy(icon_path, mipmap_dir / f"ic_launcher{ext}")
             except: pass
     else:
         for dpi in ['mdpi', 'hdpi', 'xhdpi', 'xxhdpi', 'xxxhdpi']:
             (res_dir / f"mipmap-{dpi}").mkdir(exist_ok=True)
-            (res_dir / f"mipmap-{dpi}/ic_launcher.xml").write_text('<vector xmlns:android="http://schemas.android.com/apk/res/android" android:width="24dp" android:height="24dp" android:viewportWidth="24.0" android:viewportHeight="24.0"><path android:fillColor="#000000" android:pathData="M12,2L2,22h20L12,2z"/></vector>', encoding='utf-8')
+            _emit(pending_writes, res_dir / f"mipmap-{dpi}/ic_launcher.xml", _VECTOR_ICON_BYTES)
+
+    # FLUSH + MEMOIZATION: only now are the assets needed, both to
+    # hash the cache key and to copy them into the tree. On a hit the
+    # snapshot extract replaces the queued writes and the asset copy.
+    if assets_future is not None:
+        assets_future.result()
+    cache_key = _project_cache_key(app_name, package_name, target_url,
+                                   archs, assets_path, icon_path, splash_path)
+    if _cache_restore(cache_key, android_root):
+        log("Project restored from snapshot cache (inputs unchanged)")
+        pending_writes.clear()
+    else:
+        # All queued files go out through one pool; the web-asset copy
+        # joins the same pool so it overlaps with the config writes
+        asset_copy = _EXECUTOR.submit(_fast_copytree, assets_path, assets_target / "www")
+        _flush_writes(pending_writes, extra_futures=[asset_copy], root=android_root)
+        _cache_store(cache_key, android_root)
 
     # EXECUTION
-    gradle_cmd = "gradle" if platform.system() != "Windows" else "gradle.bat"
-    if not shutil.which("gradle"): print("Gradle not found."); return
+    if not _GRADLE: print("Gradle not found."); return
 
     # BUILD BOTH DEBUG AND RELEASE
     log("Building APK (Debug) & AAB (Release)...", "INFO")
     
-    # Paths where Gradle outputs files
-    debug_apk_src = app_dir / "build/outputs/apk/debug/app-debug.apk"
-    meta_json_src = app_dir / "build/outputs/apk/debug/output-metadata.json"
-    release_aab_src = app_dir / "build/outputs/bundle/release/app-release.aab"
+    # Directories where Gradle outputs files
+    apk_out_dir = app_dir / "build/outputs/apk/debug"
+    aab_out_dir = app_dir / "build/outputs/bundle/release"
 
     # Paths where we want them in the Output folder
-    dest_apk = OUTPUT_DIR / f"{app_name}-debug.apk"
-    dest_json = OUTPUT_DIR / "output-metadata.json"
-    dest_aab = OUTPUT_DIR / f"{app_name}-release.aab"
-
-    # 1. Debug APK Build
-    subprocess.run([gradle_cmd, "assembleDebug"], cwd=android_root, check=True)
-    if debug_apk_src.exists():
-        shutil.copy(debug_apk_src, dest_apk)
-        shutil.copy(meta_json_src, dest_json)
+    dest_apk = output_dir() / f"{app_name}-debug.apk"
+    dest_json = output_dir() / "output-metadata.json"
+    dest_aab = output_dir() / f"{app_name}-release.aab"
+
+    # One invocation for both tasks: Gradle configures once, runs the
+    # shared compile/dex work once, and schedules the rest off its own
+    # task graph instead of paying JVM+configuration twice
+    subprocess.run([_GRADLE, "assembleDebug", "bundleRelease",
+                    "--parallel", "--configure-on-demand",
+                    "--build-cache", "--daemon"],
+                   cwd=android_root, check=True, env=_gradle_env())
+
+    # One scandir per output dir replaces a stat() probe per artifact —
+    # noticeable on cold caches and network-backed CI volumes
+    apk_outputs = _dir_names(apk_out_dir)
+    aab_outputs = _dir_names(aab_out_dir)
+
+    # 1. Debug APK
+    if "app-debug.apk" in apk_outputs:
+        # Hardlink when possible: the zip step then reads the artifact
+        # once instead of the copy-read-delete triple pass
+        _link_or_copy(apk_out_dir / "app-debug.apk", dest_apk)
+        if "output-metadata.json" in apk_outputs:
+            _link_or_copy(apk_out_dir / "output-metadata.json", dest_json)
         log(f"Generated: {dest_apk.name}", "INFO")
-    else: 
+    else:
         log("Debug Build Failed.", "ERROR")
 
-    # 2. Release AAB Build
-    subprocess.run([gradle_cmd, "bundleRelease"], cwd=android_root, check=True)
-    if release_aab_src.exists():
-        shutil.copy(release_aab_src, dest_aab)
+    # 2. Release AAB
+    if "app-release.aab" in aab_outputs:
+        _link_or_copy(aab_out_dir / "app-release.aab", dest_aab)
         log(f"Generated: {dest_aab.name}", "INFO")
-    else: 
+    else:
         log("Release Build Failed.", "ERROR")
 
     # =======================================================================
     # NEW FEATURE: AUTO-ZIP AND CLEANUP
     # =======================================================================
     log("Compressing artifacts into single ZIP...", "STEP")
-    zip_filename = OUTPUT_DIR / f"{app_name}.zip"
+    zip_filename = output_dir() / f"{app_name}.zip"
     
     # List of files to put inside the zip
     files_to_zip = [dest_apk, dest_json, dest_aab]
-    
-    with zipfile.ZipFile(zip_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for file_path in files_to_zip:
-            if file_path.exists():
-                # Add file to zip (arcname prevents full path directory structure)
-                zipf.write(file_path, arcname=file_path.name)
-                log(f"Added to zip: {file_path.name}", "INFO")
-        
+    present = [f for f in files_to_zip if f.exists()]
+
+    # Nothing (or one lone survivor of a half-failed build) to bundle:
+    # wrapping a single file in a zip costs a full read+write pass only
+    # for the consumer to unwrap it again. It already sits in output_dir
+    # under its final name, so just leave it there.
+    if not present:
+        log("No artifacts produced, nothing to zip.", "ERROR")
+        return
+    if len(present) == 1:
+        log(f"Single artifact, skipping zip step: {present[0].name}", "WARN")
+        log(f"FINAL OUTPUT: {present[0]}", "INFO")
+        return
+
+    # 1 MiB buffered writes amortize syscall overhead on the big stored
+    # entries, and with artifacts well under 2 GB the zip64 records and
+    # end-of-archive machinery are pure overhead
+    with open(zip_filename, 'wb', buffering=1 << 20) as raw, \
+         zipfile.ZipFile(raw, 'w', zipfile.ZIP_STORED, allowZip64=False) as zipf:
+        for file_path in present:
+            # APK/AAB are already deflated archives: recompressing burns
+            # CPU for ~0% savings, so store them and only deflate the
+            # small JSON (level 1 is plenty for metadata)
+            if file_path.suffix in ('.apk', '.aab'):
+                # Stream with a 256 KiB buffer: zipf.write's small
+                # default read chunks mean 4x the syscalls on these
+                # tens-of-MB files
+                info = zipfile.ZipInfo.from_file(file_path, arcname=file_path.name)
+                info.compress_type = zipfile.ZIP_STORED
+                with open(file_path, 'rb') as fsrc, \
+                     zipf.open(info, 'w') as fdst:
+                    shutil.copyfileobj(fsrc, fdst, length=256 * 1024)
+            elif deflate is not None:
+                _write_deflate_entry(zipf, file_path)
+            else:
+                zipf.write(file_path, arcname=file_path.name,
+                           compress_type=zipfile.ZIP_DEFLATED, compresslevel=1)
+            log(f"Added to zip: {file_path.name}", "INFO")
+
     # Verify Zip was created successfully before deleting originals
     if zip_filename.exists():
-        for file_path in files_to_zip:
-            if file_path.exists():
-                os.remove(file_path)
+        for file_path in present:
+            os.remove(file_path)
         log("Zip created successfully & temporary files removed", "INFO")
         log(f"FINAL OUTPUT: {zip_filename}", "INFO")
             
@@ -1071,26 +1832,34 @@ def main():
     icon_p = resolve_asset_path(args.icon, "Icon")
     splash_p = resolve_asset_path(args.splash, "Splash Screen")
     
-    work_dir = ROOT_DIR / f"build_{args.name}"
+    work_dir = root_dir() / f"build_{args.name}"
     assets_dir = work_dir / "assets"
     
     # STEP 1: PRE-BUILD CLEANUP
-    # We do a simple check here to clear old failed builds before starting
-    if work_dir.exists(): shutil.rmtree(work_dir, ignore_errors=True)
+    # Clear only the transient leftovers of old failed builds; wiping the
+    # whole work_dir walked every inode of a multi-GB Gradle tree and
+    # threw away the incremental state with it
+    if work_dir.exists():
+        for sub in TRANSIENT_SUBDIRS:
+            shutil.rmtree(work_dir / sub, ignore_errors=True)
 
-    work_dir.mkdir()
-    OUTPUT_DIR.mkdir(exist_ok=True)
+    work_dir.mkdir(exist_ok=True)
+    output_dir().mkdir(exist_ok=True)
     
-    # STEP 2: COMPILATION
-    bundle_website(args.url, assets_dir)    
-    build_android_native(work_dir, args.name, args.package, assets_dir, icon_p, splash_p, args.archs, args.url)
+    # STEP 2: COMPILATION (download, daemon warm-up and scaffolding overlap)
+    assets_future = bundle_website_async(args.url, assets_dir)
+    _warm_gradle_daemon()
+    build_android_native(work_dir, args.name, args.package, assets_dir, icon_p, splash_p, args.archs, args.url, assets_future=assets_future)
     
     # STEP 3: FINAL MANDATORY CLEANUP (The "Best" Logic)
     if work_dir.exists():
         try:
-            shutil.rmtree(work_dir, ignore_errors=False) 
+            for sub in TRANSIENT_SUBDIRS:
+                target = work_dir / sub
+                if target.exists():
+                    shutil.rmtree(target, ignore_errors=False)
             log("BUILD PROCESS COMPLETED & STORAGE CLEANED", "STEP")
-            print(f"Zipped output bundle is located in: {OUTPUT_DIR}")
+            print(f"Zipped output bundle is located in: {output_dir()}")
         except Exception as error:
             print(f"CRITICAL: Final cleanup failed for {work_dir}")
             print(f"ERROR: {error}")
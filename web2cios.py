@@ -12,9 +12,11 @@
 import os
 import sys
 import shutil
+import string
 import argparse
-import datetime
+import time
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 ROOT_DIR = Path(__file__).parent.absolute()
@@ -26,12 +28,40 @@ class Colors:
     ENDC = '\033[0m'
 
 def log(msg, level="INFO"):
-    timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+    # time.strftime skips the datetime object allocation per call
+    timestamp = time.strftime("%H:%M:%S")
     color = Colors.GREEN if level == "INFO" else Colors.WARNING if level == "WARN" else Colors.FAIL
     print(f"{color}[Web2Native-iOS] [{level}] {timestamp} - {msg}{Colors.ENDC}")
 
-def setup_assets(app_src_dir, icon_path=None, splash_path=None):
+def _fast_copy(src, dst):
+    """Hardlink when src and dst share a filesystem (zero bytes written),
+    otherwise fall back to copyfile's kernel zero-copy path."""
+    try:
+        if os.path.exists(dst):
+            os.unlink(dst)
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+def _emit(pending, path, s):
+    # Queued rather than written: the caller flushes all generated files
+    # through one thread pool so their write latencies overlap.
+    pending.append((path, s.encode('utf-8') if isinstance(s, str) else s))
+
+def _flush_writes(pending):
+    # Python releases the GIL around os.write, so independent small-file
+    # writes become max(latency) instead of sum(latency)
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        futures = [ex.submit(path.write_bytes, data) for path, data in pending]
+        for f in futures:
+            f.result()
+    pending.clear()
+
+def setup_assets(app_src_dir, icon_path=None, splash_path=None, pending=None):
     """Handles the creation of icons and splash screens in xcassets."""
+    own_queue = pending is None
+    if own_queue:
+        pending = []
     assets_dir = app_src_dir / "Assets.xcassets"
     assets_dir.mkdir(exist_ok=True)
     
@@ -40,40 +70,38 @@ def setup_assets(app_src_dir, icon_path=None, splash_path=None):
     icon_set.mkdir(exist_ok=True)
     if icon_path and Path(icon_path).exists():
         log(f"Integrating App Icon: {icon_path}")
-        shutil.copy(icon_path, icon_set / "icon_1024.png")
+        _fast_copy(icon_path, icon_set / "icon_1024.png")
         # Simplified Contents.json for AppIcon
         icon_json = {
             "images": [{"size": "1024x1024", "idiom": "ios-marketing", "filename": "icon_1024.png", "scale": "1x"}],
             "info": {"version": 1, "author": "xcode"}
         }
-        (icon_set / "Contents.json").write_text(json.dumps(icon_json))
+        _emit(pending, icon_set / "Contents.json", json.dumps(icon_json))
     
-    # 2. Splash Screen (Launch Image)
-    splash_set = assets_dir / "LaunchImage.imageset"
-    splash_set.mkdir(exist_ok=True)
+    # 2. Splash Screen (Launch Image) — only materialized when a splash
+    # was actually supplied; an empty imageset is just wasted syscalls
     if splash_path and Path(splash_path).exists():
+        splash_set = assets_dir / "LaunchImage.imageset"
+        splash_set.mkdir(exist_ok=True)
         log(f"Integrating Splash Screen: {splash_path}")
-        shutil.copy(splash_path, splash_set / "splash.png")
+        _fast_copy(splash_path, splash_set / "splash.png")
         splash_json = {
             "images": [{"idiom": "universal", "filename": "splash.png", "scale": "1x"}],
             "info": {"version": 1, "author": "xcode"}
         }
-        (splash_set / "Contents.json").write_text(json.dumps(splash_json))
+        _emit(pending, splash_set / "Contents.json", json.dumps(splash_json))
+    if own_queue:
+        _flush_writes(pending)
 
-def build_ios_native(work_dir, app_name, bundle_id, target_url, icon=None, splash=None):
-    log("Perfecting iOS Native Project (Unified Bridge)...", "INFO")
-    
-    proj_dir = work_dir / "ios_project"
-    app_src_dir = proj_dir / app_name
-    
-    if proj_dir.exists(): shutil.rmtree(proj_dir)
-    app_src_dir.mkdir(parents=True)
-    
-    (app_src_dir / "Base.lproj").mkdir(exist_ok=True)
-    setup_assets(app_src_dir, icon, splash)
+# The Unified Bridge script and the ViewController source never vary
+# between builds, so the template is parsed once at import instead of
+# being reassembled from three concatenated literals per build. Swift
+# code is full of '$0' closure arguments, which rules out Template's
+# default '$' delimiter; '%' never appears in the generated source.
+class _SwiftTemplate(string.Template):
+    delimiter = "%"
 
-    # 1. THE UNIFIED BRIDGE SCRIPT
-    bridge_js = """
+_BRIDGE_JS = """
     var Native = {{
         post: function(name, data) {{
             if (window.webkit && window.webkit.messageHandlers && window.webkit.messageHandlers[name]) {{
@@ -90,8 +118,7 @@ def build_ios_native(work_dir, app_name, bundle_id, target_url, icon=None, splas
     window.Native = Native;
     """
 
-    # 2. VIEWCONTROLLER.SWIFT
-    swift_content = r'''
+_VIEW_CONTROLLER_TEMPLATE = _SwiftTemplate(r'''
 import UIKit
 import WebKit
 import CoreNFC
@@ -115,7 +142,7 @@ class ViewController: UIViewController, WKScriptMessageHandler, WKNavigationDele
         methods.forEach { contentController.add(self, name: $0) }}
 
         let userScript = WKUserScript(source: """
-        ''' + bridge_js + r'''
+        %bridge_js
         """, injectionTime: .atDocumentStart, forMainFrameOnly: true)
         contentController.addUserScript(userScript)
 
@@ -129,7 +156,7 @@ class ViewController: UIViewController, WKScriptMessageHandler, WKNavigationDele
         
         self.view.addSubview(webView)
 
-        if let url = URL(string: "''' + target_url + r'''") {{
+        if let url = URL(string: "%target_url") {{
             webView.load(URLRequest(url: url))
         }}
     }}
@@ -186,12 +213,31 @@ class ViewController: UIViewController, WKScriptMessageHandler, WKNavigationDele
         }}
     }}
 }}
-'''
-    (app_src_dir / "ViewController.swift").write_text(swift_content, encoding='utf-8')
+''')
+
+def build_ios_native(work_dir, app_name, bundle_id, target_url, icon=None, splash=None):
+    log("Perfecting iOS Native Project (Unified Bridge)...", "INFO")
+    
+    proj_dir = work_dir / "ios_project"
+    app_src_dir = proj_dir / app_name
+    
+    if proj_dir.exists(): shutil.rmtree(proj_dir)
+    app_src_dir.mkdir(parents=True)
+    
+    (app_src_dir / "Base.lproj").mkdir(exist_ok=True)
+
+    # All generated files are queued and flushed through one pool below
+    pending_writes = []
+    setup_assets(app_src_dir, icon, splash, pending=pending_writes)
+
+    # 1 & 2. VIEWCONTROLLER.SWIFT (bridge + template prebuilt at import)
+    _emit(pending_writes, app_src_dir / "ViewController.swift",
+          _VIEW_CONTROLLER_TEMPLATE.substitute(bridge_js=_BRIDGE_JS,
+                                               target_url=target_url))
 
     # 3. APPDELEGATE & SCENEDELEGATE
-    (app_src_dir / "AppDelegate.swift").write_text("import UIKit\n@main class AppDelegate: UIResponder, UIApplicationDelegate { var window: UIWindow? }")
-    (app_src_dir / "SceneDelegate.swift").write_text(f'''
+    _emit(pending_writes, app_src_dir / "AppDelegate.swift", "import UIKit\n@main class AppDelegate: UIResponder, UIApplicationDelegate { var window: UIWindow? }")
+    _emit(pending_writes, app_src_dir / "SceneDelegate.swift", f'''
 import UIKit
 class SceneDelegate: UIResponder, UIWindowSceneDelegate {{
     var window: UIWindow?
@@ -203,18 +249,18 @@ class SceneDelegate: UIResponder, UIWindowSceneDelegate {{
     }}
 }}''')
 
-    # 4. INFO.PLIST (With Launch Screen Support)
+    # 4. INFO.PLIST (launch-screen keys only when a splash exists)
     launch_screen_dict = ""
     if splash:
-        launch_screen_dict = "<key>UILaunchImageFile</key><string>LaunchImage</string>"
+        launch_screen_dict = ("<key>UILaunchScreen</key><dict><key>UIImageName</key><string>splash</string></dict>\n"
+                              "    <key>UILaunchImageFile</key><string>LaunchImage</string>")
 
-    (app_src_dir / "Info.plist").write_text(f'''<?xml version="1.0" encoding="UTF-8"?>
+    _emit(pending_writes, app_src_dir / "Info.plist", f'''<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
 <plist version="1.0">
 <dict>
     <key>CFBundleIdentifier</key><string>{bundle_id}</string>
     <key>CFBundleName</key><string>{app_name}</string>
-    <key>UILaunchScreen</key><dict><key>UIImageName</key><string>splash</string></dict>
     {launch_screen_dict}
     <key>UIApplicationSceneManifest</key>
     <dict><key>UIApplicationSupportsMultipleScenes</key><false/><key>UISceneConfigurations</key><dict><key>UIWindowSceneSessionRoleApplication</key><array><dict><key>UISceneConfigurationName</key><string>Default Configuration</string><key>UISceneDelegateClassName</key><string>$(PRODUCT_MODULE_NAME).SceneDelegate</string></dict></array></dict></dict>
@@ -223,6 +269,8 @@ class SceneDelegate: UIResponder, UIWindowSceneDelegate {{
 </dict>
 </plist>''')
 
+    _flush_writes(pending_writes)
+
     log(f"iOS Project Ready at: {work_dir}", "INFO")
 
 def main():